@@ -5,3 +5,4 @@ VIDEO_DIR = "assets/temp/videos"
 IMAGE_DIR = "assets/temp/images"
 ASSET_FOLDER = Path("assets/temp/")
 OUTPUT_FOLDER = Path("assets/temp/outputs")
+WEBPAGE_CACHE_DIR = Path("assets/cache/webpages")
@@ -1,6 +1,7 @@
 """Langfuse configuration and instrumentation setup for Frame AI."""
 
 import os
+from functools import cached_property
 from typing import Optional
 from dotenv import load_dotenv
 from langfuse import Langfuse
@@ -20,35 +21,38 @@ class LangfuseConfig:
         self.enabled = os.getenv("LANGFUSE_ENABLED", "false").lower() == "true"
         self._client: Optional[Langfuse] = None
 
-    @property
+    @cached_property
     def is_configured(self) -> bool:
-        """Check if Langfuse is properly configured."""
+        """Check if Langfuse is properly configured (env is read once at startup)."""
         return bool(self.public_key and self.secret_key and self.enabled)
 
     def get_client(self) -> Optional[Langfuse]:
         """Get or create Langfuse client instance."""
+        # Fast path: client already initialized
+        if self._client is not None:
+            return self._client
+
         if not self.is_configured:
             logger.warning(
                 "Langfuse is not configured. Set LANGFUSE_ENABLED=true and provide API keys."
             )
             return None
 
-        if self._client is None:
-            try:
-                # Initialize with optimized settings for better performance
-                self._client = Langfuse(
-                    public_key=self.public_key,
-                    secret_key=self.secret_key,
-                    host=self.host,
-                    debug=False,  # Suppress debug output
-                    flush_interval=1.0,  # Flush more frequently
-                )
-                logger.info(
-                    f"Langfuse client initialized successfully (host: {self.host})"
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize Langfuse client: {e}")
-                return None
+        try:
+            # Initialize with optimized settings for better performance
+            self._client = Langfuse(
+                public_key=self.public_key,
+                secret_key=self.secret_key,
+                host=self.host,
+                debug=False,  # Suppress debug output
+                flush_interval=1.0,  # Flush more frequently
+            )
+            logger.info(
+                f"Langfuse client initialized successfully (host: {self.host})"
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize Langfuse client: {e}")
+            return None
 
         return self._client
 
@@ -22,10 +22,14 @@ class CustomFormatter(logging.Formatter):
             logging.ERROR: self.red + self.fmt + self.reset,
             logging.CRITICAL: self.bold_red + self.fmt + self.reset,
         }
+        # Build one formatter per level up front instead of on every record
+        self._formatters = {
+            level: logging.Formatter(log_fmt) for level, log_fmt in self.FORMATS.items()
+        }
+        self._default_formatter = logging.Formatter(self.fmt)
 
     def format(self, record: logging.LogRecord) -> str:
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        formatter = self._formatters.get(record.levelno, self._default_formatter)
         return formatter.format(record)
 
 
@@ -57,6 +61,10 @@ def get_stream_handler() -> logging.StreamHandler:
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
+    # Configure each named logger only once, so repeated calls don't stack
+    # handlers and emit (and format) every record multiple times
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.INFO)
     logger.addFilter(CustomFilter())
     # logger.addHandler(get_file_handler())
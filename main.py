@@ -2,6 +2,8 @@
 """
 ReelCraft - Start the API server
 """
+import os
+
 import uvicorn
 
 
@@ -21,8 +23,18 @@ def main():
         "services.api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        reload=os.getenv("RELOAD", "0") == "1",
+        workers=int(os.getenv("WORKERS", "1")),
+        log_level="info",
+        # uvloop + httptools (C event loop and HTTP parser) when installed,
+        # which uvicorn[standard] does except on Windows; asyncio + h11 otherwise
+        loop="auto",
+        http="auto",
+        limit_concurrency=1000,
+        # Browsers reuse the connection across video Range requests
+        timeout_keep_alive=30,
+        ws_ping_interval=None,
+        ws_ping_timeout=None,
     )
 
 
@@ -4,6 +4,7 @@ Script to add existing video from outputs folder to database.
 
 import asyncio
 from pathlib import Path
+from services.cleanup import size_in_mb
 from services.database import async_session, Video, StorageLocation
 
 
@@ -25,7 +26,7 @@ async def add_video():
 
     # Get file size in MB
     size_bytes = full_path.stat().st_size
-    size_mb = round(size_bytes / (1024 * 1024), 2)
+    size_mb = size_in_mb(size_bytes)
 
     # Duration from ffprobe (91.609 seconds)
     duration = 91.609
@@ -38,20 +39,22 @@ async def add_video():
     print(f"  Duration: {duration:.2f} seconds")
 
     async with async_session() as session:
-        # Check if video already exists
-        from sqlalchemy import select
+        # Repoint an existing entry in one statement; source_url has no unique
+        # index, so an INSERT ... ON CONFLICT upsert isn't available here
+        from sqlalchemy import update
         result = await session.execute(
-            select(Video).where(Video.source_url == source_url)
+            update(Video)
+            .where(Video.source_url == source_url)
+            .values(storage_location=StorageLocation.LOCAL, file_path=str(video_path))
+            .returning(Video.id)
         )
-        existing = result.scalar_one_or_none()
+        existing_ids = result.scalars().all()
 
-        if existing:
-            print(f"\nVideo already exists in database with ID: {existing.id}")
-            print(f"Updating storage location to LOCAL...")
-            existing.storage_location = StorageLocation.LOCAL
-            existing.file_path = str(video_path)
+        if existing_ids:
             await session.commit()
-            print(f"Updated video ID {existing.id}")
+            for video_id in existing_ids:
+                print(f"\nVideo already exists in database with ID: {video_id}")
+                print(f"Updated storage location to LOCAL for video ID {video_id}")
             return
 
         # Create new video entry
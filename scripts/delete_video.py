@@ -53,18 +53,16 @@ async def delete_video_direct(video_id: int):
         storage_deleted = False
         if storage_location == StorageLocation.CLOUD:
             # Extract object key from cloud URL
-            if file_path and file_path.startswith(("http://", "https://")):
-                parts = file_path.split("/")
-                if len(parts) >= 3:
-                    object_key = "/".join(parts[-3:])
-                    print(f"Deleting from cloud storage: {object_key}")
-                    storage_deleted = await storage_manager.delete_video(object_key)
-                    if storage_deleted:
-                        print("✓ Cloud file deleted")
-                    else:
-                        print("✗ Could not delete cloud file (may not be enabled or file not found)")
+            object_key = storage_manager.object_key_from_url(file_path)
+            if object_key:
+                print(f"Deleting from cloud storage: {object_key}")
+                storage_deleted = await storage_manager.delete_video(object_key)
+                if storage_deleted:
+                    print("✓ Cloud file deleted")
                 else:
-                    print(f"✗ Could not parse object key from URL: {file_path}")
+                    print("✗ Could not delete cloud file (may not be enabled or file not found)")
+            else:
+                print(f"✗ Could not parse object key from URL: {file_path}")
         else:  # LOCAL
             if file_path:
                 print(f"Deleting local file: {file_path}")
@@ -89,19 +87,21 @@ async def delete_video_direct(video_id: int):
 async def list_videos():
     """List all videos in the database."""
     async with async_session() as session:
+        # Only the printed columns; skips building full Video instances
         result = await session.execute(
-            select(Video).order_by(Video.created_at.desc())
+            select(
+                Video.id, Video.title, Video.storage_location, Video.file_path
+            ).order_by(Video.created_at.desc())
         )
-        videos = result.scalars().all()
 
         print("\n" + "=" * 70)
         print("ALL VIDEOS IN DATABASE")
         print("=" * 70)
-        for video in videos:
-            print(f"\nID: {video.id}")
-            print(f"Title: {video.title}")
-            print(f"Storage: {video.storage_location.value}")
-            print(f"File: {video.file_path[:60]}..." if len(video.file_path) > 60 else f"File: {video.file_path}")
+        for video_id, title, storage_location, file_path in result:
+            print(f"\nID: {video_id}")
+            print(f"Title: {title}")
+            print(f"Storage: {storage_location.value}")
+            print(f"File: {file_path[:60]}..." if len(file_path) > 60 else f"File: {file_path}")
         print("=" * 70)
 
 
@@ -1,12 +1,23 @@
 """
 Fix storage_location case in database (lowercase to uppercase).
+
+Usage: python scripts/fix_storage_case.py [--verbose]
 """
 
 import sqlite3
+import sys
 from pathlib import Path
 
 
-def fix_storage_case():
+def print_storage_locations(cursor, label: str):
+    """Print every video's storage_location."""
+    cursor.execute("SELECT id, title, storage_location FROM videos")
+    print(f"\n{label}:")
+    for vid in cursor.fetchall():
+        print(f"  [{vid[0]}] {vid[1]}: {vid[2]}")
+
+
+def fix_storage_case(verbose: bool = False):
     """Convert storage_location values to uppercase."""
     db_path = Path.cwd() / "reelcraft.db"
 
@@ -16,38 +27,34 @@ def fix_storage_case():
 
     print(f"Fixing storage_location case in: {db_path}")
 
-    # Connect to database
-    conn = sqlite3.connect(db_path)
+    # Connect to database. isolation_level=None hands transaction control to
+    # us, so the write lock is held only around the UPDATE itself.
+    conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
 
     try:
-        # Show current state
-        cursor.execute("SELECT id, title, storage_location FROM videos")
-        videos = cursor.fetchall()
-        print("\nBefore fix:")
-        for vid in videos:
-            print(f"  [{vid[0]}] {vid[1]}: {vid[2]}")
-
-        # Update to uppercase
-        cursor.execute("UPDATE videos SET storage_location = 'LOCAL' WHERE storage_location = 'local'")
-        local_updated = cursor.rowcount
-
-        cursor.execute("UPDATE videos SET storage_location = 'CLOUD' WHERE storage_location = 'cloud'")
-        cloud_updated = cursor.rowcount
+        if verbose:
+            print_storage_locations(cursor, "Before fix")
 
-        conn.commit()
+        # Update to uppercase in a single pass over the table
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute(
+            "UPDATE videos SET storage_location = UPPER(storage_location) "
+            "WHERE storage_location IN ('local', 'cloud')"
+        )
+        updated = cursor.rowcount
+        cursor.execute("COMMIT")
 
-        # Show updated state
-        cursor.execute("SELECT id, title, storage_location FROM videos")
-        videos = cursor.fetchall()
-        print("\nAfter fix:")
-        for vid in videos:
-            print(f"  [{vid[0]}] {vid[1]}: {vid[2]}")
+        if verbose:
+            print_storage_locations(cursor, "After fix")
 
-        print(f"\nUpdated {local_updated} LOCAL and {cloud_updated} CLOUD entries")
+        print(f"\nUpdated {updated} entries")
 
     except Exception as e:
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
         print(f"Error: {e}")
         raise
     finally:
@@ -55,4 +62,4 @@ def fix_storage_case():
 
 
 if __name__ == "__main__":
-    fix_storage_case()
+    fix_storage_case(verbose="--verbose" in sys.argv[1:])
@@ -0,0 +1,62 @@
+"""
+Migration script to add the query indexes to an existing database.
+
+This script:
+1. Creates ix_videos_url_created on videos (source_url, created_at)
+   so the duplicate-URL check in /api/generate-video is an index lookup
+2. Creates ix_jobs_created_id on jobs (created_at, id) so /api/jobs can
+   page newest-first with a cursor without sorting the table
+
+New databases get the indexes from init_db(); this is only needed for
+databases created before they were added.
+"""
+
+import sqlite3
+from pathlib import Path
+
+INDEXES = [
+    ("ix_videos_url_created", "CREATE INDEX ix_videos_url_created ON videos (source_url, created_at)"),
+    ("ix_jobs_created_id", "CREATE INDEX ix_jobs_created_id ON jobs (created_at, id)"),
+]
+
+
+def migrate():
+    """Create any missing indexes."""
+    db_path = Path.cwd() / "reelcraft.db"
+
+    if not db_path.exists():
+        print("Database not found. It will be created with the indexes on first run.")
+        return
+
+    print(f"Migrating database at: {db_path}")
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    cursor = conn.cursor()
+
+    try:
+        created = 0
+        for name, create_sql in INDEXES:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+            )
+            if cursor.fetchone():
+                print(f"{name} already exists. Skipping.")
+                continue
+
+            print(f"Creating {name} index...")
+            cursor.execute(create_sql)
+            created += 1
+
+        if created:
+            cursor.execute("ANALYZE")
+        print("Migration completed successfully!")
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
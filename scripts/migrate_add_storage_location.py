@@ -24,9 +24,12 @@ async def migrate():
 
     print(f"Migrating database at: {db_path}")
 
-    # Connect to database
-    conn = sqlite3.connect(db_path)
+    # Connect to database. isolation_level=None hands transaction control to
+    # us, so the ALTER TABLE and the backfill commit together in one fsync.
+    conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
 
     try:
         # Check if storage_location column already exists
@@ -38,6 +41,7 @@ async def migrate():
             return
 
         print("Adding storage_location column...")
+        cursor.execute("BEGIN IMMEDIATE")
 
         # Add the new column with default value 'LOCAL'
         cursor.execute("""
@@ -54,7 +58,7 @@ async def migrate():
 
         affected_rows = cursor.rowcount
 
-        conn.commit()
+        cursor.execute("COMMIT")
         print(f"Migration completed successfully!")
         print(f"Updated {affected_rows} videos to cloud storage location.")
 
@@ -66,7 +70,8 @@ async def migrate():
             print(f"  {location}: {count} videos")
 
     except Exception as e:
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
         print(f"Error during migration: {e}")
         raise
     finally:
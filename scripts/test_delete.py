@@ -5,9 +5,10 @@ This script performs a dry-run test without actually deleting anything.
 
 import asyncio
 from pathlib import Path
+from services.cleanup import BYTES_PER_MB
 from services.database import async_session, Video, StorageLocation
 from services.storage import storage_manager
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 
 async def test_delete_logic():
@@ -15,16 +16,20 @@ async def test_delete_logic():
 
     async with async_session() as session:
         # Get all videos
+        # Only the columns the report uses; skips building full Video instances
         result = await session.execute(
-            select(Video).order_by(Video.created_at.desc())
+            select(
+                Video.id, Video.title, Video.storage_location, Video.file_path
+            ).order_by(Video.created_at.desc())
         )
-        videos = result.scalars().all()
+        videos = result.all()
 
         print("=" * 70)
         print("VIDEO DELETE TEST (DRY RUN)")
         print("=" * 70)
         print(f"\nTotal videos in database: {len(videos)}\n")
 
+        cwd = Path.cwd()
         for video in videos:
             print("-" * 70)
             print(f"Video ID: {video.id}")
@@ -35,29 +40,25 @@ async def test_delete_logic():
             # Check what would happen on delete
             if video.storage_location == StorageLocation.CLOUD:
                 print(f"\n[CLOUD DELETE LOGIC]")
-                if video.file_path and video.file_path.startswith(("http://", "https://")):
-                    parts = video.file_path.split("/")
-                    if len(parts) >= 3:
-                        object_key = "/".join(parts[-3:])
-                        print(f"  Would delete from R2 with object_key: {object_key}")
-                        print(f"  R2 Enabled: {storage_manager.is_enabled()}")
-                    else:
-                        print(f"  ERROR: Could not parse object key from URL")
+                object_key = storage_manager.object_key_from_url(video.file_path)
+                if object_key:
+                    print(f"  Would delete from R2 with object_key: {object_key}")
+                    print(f"  R2 Enabled: {storage_manager.is_enabled()}")
                 else:
-                    print(f"  ERROR: Invalid cloud URL")
+                    print(f"  ERROR: Could not parse object key from URL")
 
             else:  # LOCAL
                 print(f"\n[LOCAL DELETE LOGIC]")
                 if video.file_path:
                     local_path = Path(video.file_path)
                     if not local_path.is_absolute():
-                        local_path = Path.cwd() / local_path
+                        local_path = cwd / local_path
 
                     print(f"  Absolute path: {local_path}")
                     print(f"  File exists: {local_path.exists()}")
 
                     if local_path.exists():
-                        size_mb = local_path.stat().st_size / (1024 * 1024)
+                        size_mb = local_path.stat().st_size / BYTES_PER_MB
                         print(f"  File size: {size_mb:.2f} MB")
                         print(f"  Would delete file: {local_path}")
                     else:
@@ -68,12 +69,19 @@ async def test_delete_logic():
             print(f"\n  Database entry would be deleted: YES")
             print()
 
+        # Let SQLite count per location instead of two passes over the rows
+        counts = dict(
+            (await session.execute(
+                select(Video.storage_location, func.count()).group_by(Video.storage_location)
+            )).all()
+        )
+
         print("=" * 70)
         print("TEST SUMMARY")
         print("=" * 70)
         print(f"Total videos: {len(videos)}")
-        print(f"Cloud videos: {sum(1 for v in videos if v.storage_location == StorageLocation.CLOUD)}")
-        print(f"Local videos: {sum(1 for v in videos if v.storage_location == StorageLocation.LOCAL)}")
+        print(f"Cloud videos: {counts.get(StorageLocation.CLOUD, 0)}")
+        print(f"Local videos: {counts.get(StorageLocation.LOCAL, 0)}")
         print("\nNo actual deletions were performed (dry run).")
         print("=" * 70)
 
@@ -1,38 +1,67 @@
 from pathlib import Path
 from typing import Optional
-import json
+from dataclasses import dataclass, field
+import asyncio
+import functools
+import hashlib
+import os
+import stat
+import time
 import uuid
+from urllib.parse import quote
+import orjson
 from datetime import datetime
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response
 from pydantic import BaseModel, HttpUrl
-from sqlalchemy import select
+from sqlalchemy import insert, select, tuple_, update
 from services.pipeline import pipeline
 from config.directories import OUTPUT_FOLDER
-from services.database import init_db, async_session, Job, Video, JobStatus, StorageLocation
+from utils.http_client import close_shared_client
+from services.database import init_db, async_session, new_job_id, Job, Video, JobStatus, StorageLocation
 from services.job_manager import job_manager, JobProgress
-from services.cleanup import cleanup_generation_assets
+from services.cleanup import BYTES_PER_MB, cleanup_generation_assets, size_in_mb
 from services.storage import storage_manager
-import logging
+from services.pagination import encode_cursor, decode_cursor
+from services.url_cache import init_url_cache, close_url_cache, get_cached_video_id, cache_video_id, forget_video_url
+from services.responses import VideoFileResponse
+from config.logger import get_logger
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# The server never changes directory, so resolve the working directory once
+# instead of calling getcwd() for every job and request.
+CWD = Path.cwd().resolve()
+# Resolved once for the legacy endpoint's path-traversal check
+OUTPUT_FOLDER_RESOLVED = (CWD / OUTPUT_FOLDER).resolve()
+
+# Behind nginx, set to an internal location that aliases the project root
+# (e.g. "/protected/") to have nginx sendfile() local videos itself.
+X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX")
 
 app = FastAPI(
     title="ReelCraft API",
     description="API for generating short-form videos from articles",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup."""
+    """Initialize database and URL cache on startup."""
     await init_db()
     logger.info("Database initialized")
+    await init_url_cache()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled outbound HTTP and Redis connections."""
+    await close_shared_client()
+    await close_url_cache()
 
 
 # Configure CORS
@@ -88,23 +117,207 @@ class HealthResponse(BaseModel):
     message: str
 
 
-# Store active WebSocket connections
-active_connections: list[WebSocket] = []
+# Maximum number of undelivered broadcast messages buffered per client
+CHANNEL_QUEUE_SIZE = 32
+
+# Seconds of client silence before the server sends an application-level ping.
+# Protocol-level pings are disabled in uvicorn.run (ws_ping_interval=None).
+WS_HEARTBEAT_INTERVAL = 30
+
+
+@dataclass(eq=False)
+class Channel:
+    """A WebSocket client with its own outgoing broadcast queue."""
+    websocket: WebSocket
+    queue: asyncio.Queue[str] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=CHANNEL_QUEUE_SIZE)
+    )
+    task: Optional[asyncio.Task] = None
+
+    def push(self, message: str):
+        """
+        Queue a message without waiting on the client.
+
+        When the client has fallen CHANNEL_QUEUE_SIZE messages behind, the
+        oldest queued message is shed so it still receives the latest progress.
+        """
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.queue.get_nowait()
+            self.queue.put_nowait(message)
+            logger.warning("WebSocket client is lagging, dropped oldest message")
+
+
+# Store active WebSocket channels
+active_channels: set[Channel] = set()
+
+# Channels subscribed to each job, so job messages reach only those clients
+job_subscribers: dict[str, set[Channel]] = {}
+
+
+def unsubscribe_channel(channel: Channel, job_id: str):
+    """Remove a channel from a job's subscribers."""
+    subscribers = job_subscribers.get(job_id)
+    if subscribers is not None:
+        subscribers.discard(channel)
+        if not subscribers:
+            del job_subscribers[job_id]
+
+# Frames that never change, encoded once
+WS_CONNECTED_FRAME = orjson.dumps(
+    {"type": "connection", "message": "Connected to ReelCraft API"}
+).decode()
+WS_PING_FRAME = orjson.dumps({"type": "ping"}).decode()
+
+
+@functools.lru_cache(maxsize=64)
+def job_progress_frame(job_id: str, progress: int, message: str) -> str:
+    """
+    Encode a job_progress frame.
+
+    Every subscriber of a job receives the same update, so the first one
+    encodes it and the rest reuse the cached string.
+    """
+    return orjson.dumps(
+        {
+            "type": "job_progress",
+            "job_id": job_id,
+            "progress": progress,
+            "message": message,
+        }
+    ).decode()
+
+
+async def send_frame(websocket: WebSocket, frame: dict):
+    """Encode a frame with orjson and send it as text (the browser JSON.parses it)."""
+    await websocket.send_text(orjson.dumps(frame).decode())
 
 
-async def broadcast_progress(message: str):
-    """Broadcast progress updates to all connected WebSocket clients"""
-    for connection in active_connections:
+async def relay(channel: Channel):
+    """Drain a channel's queue and forward each message to its WebSocket."""
+    while True:
+        message = await channel.queue.get()
         try:
-            await connection.send_json({"type": "progress", "message": message})
+            await channel.websocket.send_text(message)
         except Exception as e:
-            logger.error(f"Error broadcasting to websocket: {e}")
+            logger.error(f"Error relaying to websocket: {e}")
+            active_channels.discard(channel)
+            return
+
+
+async def broadcast_progress(message: str, job_id: Optional[str] = None):
+    """
+    Broadcast progress updates to connected WebSocket clients.
+
+    With a job_id, only clients subscribed to that job receive the message;
+    otherwise every client does. Messages are queued per client and
+    delivered by each channel's relay task, so a slow client never blocks
+    the caller or other clients.
+    """
+    channels = job_subscribers.get(job_id, ()) if job_id else active_channels
+    if not channels:
+        return
+
+    # Encode once with orjson; sent as a text frame so the browser can JSON.parse it
+    payload = orjson.dumps({"type": "progress", "message": message}).decode()
+    dead: list[Channel] = []
+
+    # Iterate a snapshot so disconnects can't mutate the set underneath us
+    for channel in tuple(channels):
+        if channel.task is None or channel.task.done():
+            dead.append(channel)
+            continue
+        channel.push(payload)
+
+    for channel in dead:
+        active_channels.discard(channel)
+        if job_id:
+            unsubscribe_channel(channel, job_id)
+
+
+# Cached /api/videos responses keyed by query parameters, stored as
+# (monotonic timestamp, response). Cleared whenever this process adds or
+# deletes a video; the TTL bounds how stale a page can be when another
+# worker or a script writes to the videos table.
+VIDEOS_CACHE_TTL = 5  # seconds
+VIDEOS_CACHE_MAX_ENTRIES = 128
+_videos_cache: dict[tuple, tuple[float, dict]] = {}
+
+
+def invalidate_videos_cache():
+    """Drop all cached video listings."""
+    _videos_cache.clear()
+
+
+# Columns returned by /api/videos (same keys as Video.to_dict())
+VIDEO_LIST_COLUMNS = (
+    Video.id,
+    Video.title,
+    Video.source_url,
+    Video.file_path,
+    Video.storage_location,
+    Video.duration,
+    Video.size_mb,
+    Video.created_at,
+)
+
+
+def stat_video_file(path: Path) -> Optional[os.stat_result]:
+    """stat() a video once; None unless it exists and is a regular file."""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
 
 
-@app.get("/", response_class=FileResponse)
-async def root():
+def video_file_response(
+    video_path: Path, filename: str, video_stat: os.stat_result
+) -> Response:
+    """
+    Serve a local video that has already been stat()ed.
+
+    With X_ACCEL_REDIRECT_PREFIX set, the body is left to the reverse proxy;
+    otherwise the file is streamed with the precomputed stat_result.
+    """
+    if X_ACCEL_REDIRECT_PREFIX:
+        try:
+            relative_path = video_path.relative_to(CWD).as_posix()
+        except ValueError:
+            relative_path = None
+        if relative_path is not None:
+            # Same Content-Disposition as FileResponse(filename=...)
+            quoted_name = quote(filename)
+            if quoted_name != filename:
+                disposition = f"attachment; filename*=utf-8''{quoted_name}"
+            else:
+                disposition = f'attachment; filename="{filename}"'
+            return Response(
+                media_type="video/mp4",
+                headers={
+                    "X-Accel-Redirect": quote(X_ACCEL_REDIRECT_PREFIX + relative_path),
+                    "Content-Disposition": disposition,
+                },
+            )
+
+    return VideoFileResponse(
+        video_path, media_type="video/mp4", filename=filename, stat_result=video_stat
+    )
+
+
+# The frontend entry page is static, so read it once and serve it from memory
+_INDEX_HTML = Path("frontend/index.html").read_bytes()
+_INDEX_ETAG = f'"{hashlib.md5(_INDEX_HTML).hexdigest()}"'
+_INDEX_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "public, max-age=300"}
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
     """Serve the frontend HTML"""
-    return FileResponse("frontend/index.html")
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+    return HTMLResponse(content=_INDEX_HTML, headers=_INDEX_HEADERS)
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -123,7 +336,7 @@ async def video_generation_job(job_id: str, progress_callback, url: str):
         url: Article URL to process
     """
     # Broadcast to WebSocket connections
-    await broadcast_progress(f"Starting video generation for: {url}")
+    await broadcast_progress(f"Starting video generation for: {url}", job_id)
 
     # Run pipeline with progress tracking
     result = await pipeline(url, progress_callback=progress_callback)
@@ -131,60 +344,40 @@ async def video_generation_job(job_id: str, progress_callback, url: str):
     # Calculate file size
     video_path = Path(result["output_video"])
     if not video_path.is_absolute():
-        video_path = Path.cwd() / video_path
+        video_path = CWD / video_path
 
-    size_mb = video_path.stat().st_size / (1024 * 1024) if video_path.exists() else None
+    try:
+        size_mb = size_in_mb((await asyncio.to_thread(video_path.stat)).st_size)
+    except FileNotFoundError:
+        size_mb = None
 
     # Create video entry and optionally upload to cloud
     video = None
     async with async_session() as session:
-        # Determine file path based on cloud storage availability
+        # Upload first under a pre-assigned key, so the row is inserted once
+        # with its final location instead of as a placeholder that is updated
         if storage_manager.is_enabled():
-            await broadcast_progress("Uploading video to cloud storage...")
-            try:
-                # Create video entry with placeholder
+            await broadcast_progress("Uploading video to cloud storage...", job_id)
+            cloud_url = await storage_manager.upload_video(str(video_path), uuid.uuid4().hex)
+
+            if cloud_url:
+                logger.info(f"Video uploaded to cloud: {cloud_url}")
                 video = Video(
                     title=result["title"],
                     source_url=url,
-                    file_path="uploading...",
-                    size_mb=round(size_mb, 2) if size_mb else None,
-                    script_json=json.dumps(result["script"]),
+                    file_path=cloud_url,
+                    storage_location=StorageLocation.CLOUD,
+                    size_mb=size_mb,
+                    script_json=orjson.dumps(result["script"]).decode(),
                 )
-                session.add(video)
-                await session.commit()
-                await session.refresh(video)
-
-                # Upload to cloud
-                cloud_url = await storage_manager.upload_video(str(video_path), video.id)
-
-                if cloud_url:
-                    logger.info(f"Video uploaded to cloud: {cloud_url}")
-                    video.file_path = cloud_url
-                    video.storage_location = StorageLocation.CLOUD
-                    await broadcast_progress("Video uploaded to cloud storage")
-                else:
-                    # Cloud upload failed, use local path
-                    logger.warning("Cloud upload failed, falling back to local path")
-                    try:
-                        relative_path = video_path.relative_to(Path.cwd())
-                        video.file_path = str(relative_path)
-                    except ValueError:
-                        video.file_path = str(video_path)
-                    video.storage_location = StorageLocation.LOCAL
+                await broadcast_progress("Video uploaded to cloud storage", job_id)
+            else:
+                logger.warning("Cloud upload failed, falling back to local path")
 
-                await session.commit()
-                await session.refresh(video)
-
-            except Exception as e:
-                logger.error(f"Error during cloud upload: {e}")
-                # If video wasn't created, we'll create it below with local path
-                if not video:
-                    raise
-
-        # If cloud storage not enabled, create video with local path
+        # If cloud storage not enabled (or the upload failed), use the local path
         if not video:
             try:
-                relative_path = video_path.relative_to(Path.cwd())
+                relative_path = video_path.relative_to(CWD)
                 file_path_str = str(relative_path)
             except ValueError:
                 file_path_str = str(video_path)
@@ -195,27 +388,32 @@ async def video_generation_job(job_id: str, progress_callback, url: str):
                 source_url=url,
                 file_path=file_path_str,
                 storage_location=StorageLocation.LOCAL,
-                size_mb=round(size_mb, 2) if size_mb else None,
-                script_json=json.dumps(result["script"]),
+                size_mb=size_mb,
+                script_json=orjson.dumps(result["script"]).decode(),
             )
-            session.add(video)
-            await session.commit()
-            await session.refresh(video)
 
-        # Update job with video_id
-        result_db = await session.execute(select(Job).where(Job.id == job_id))
-        job = result_db.scalar_one_or_none()
-        if job:
-            job.video_id = video.id
-            await session.commit()
+        session.add(video)
+        # Flush for the id; the commit below covers the insert and job link
+        await session.flush()
 
-        await broadcast_progress(f"Video generation completed! Video ID: {video.id}")
+        # Link the job to its video without loading the Job row first
+        await session.execute(
+            update(Job).where(Job.id == job_id).values(video_id=video.id)
+        )
+        await session.commit()
+
+        invalidate_videos_cache()
+        await cache_video_id(url, video.id)
+        await broadcast_progress(f"Video generation completed! Video ID: {video.id}", job_id)
 
     # Clean up temporary assets after successful generation
     try:
-        await broadcast_progress("Cleaning up temporary files...")
-        cleaned_count, cleaned_size = cleanup_generation_assets(result["title"])
-        cleaned_mb = cleaned_size / (1024 * 1024)
+        await broadcast_progress("Cleaning up temporary files...", job_id)
+        # Deleting the intermediate files is blocking disk I/O; keep it off the event loop
+        cleaned_count, cleaned_size = await asyncio.to_thread(
+            cleanup_generation_assets, result["title"]
+        )
+        cleaned_mb = cleaned_size / BYTES_PER_MB
         logger.info(f"Cleaned up {cleaned_count} files ({cleaned_mb:.2f} MB)")
     except Exception as e:
         logger.error(f"Error during cleanup: {e}")
@@ -242,46 +440,63 @@ async def generate_video(request: VideoGenerationRequest):
 
         # Check if we already have a video for this URL
         async with async_session() as session:
-            result = await session.execute(
-                select(Video)
-                .where(Video.source_url == url)
-                .order_by(Video.created_at.desc())
-            )
-            existing_video = result.scalar_one_or_none()
+            # Try the URL cache first: a primary key lookup instead of a
+            # source_url scan. Stale entries (deleted videos) fall through.
+            existing_video = None
+            cached_video_id = await get_cached_video_id(url)
+            if cached_video_id is not None:
+                existing_video = await session.get(Video, cached_video_id)
+                if existing_video is not None and existing_video.source_url != url:
+                    existing_video = None
+
+            if existing_video is None:
+                result = await session.execute(
+                    select(Video)
+                    .where(Video.source_url == url)
+                    .order_by(Video.created_at.desc())
+                    .limit(1)
+                )
+                existing_video = result.scalar_one_or_none()
+                if existing_video:
+                    await cache_video_id(url, existing_video.id)
 
             if existing_video:
                 logger.info(
                     f"Found existing video (ID: {existing_video.id}) for URL: {url}"
                 )
 
-                # Create a "fake" completed job entry for consistency
-                job = Job(
-                    id=str(uuid.uuid4()),
-                    status=JobStatus.COMPLETED,
-                    progress=100,
-                    progress_message=f"Video already exists (reused from cache)",
-                    video_id=existing_video.id,
-                    started_at=datetime.utcnow(),
-                    completed_at=datetime.utcnow(),
+                # Create a "fake" completed job entry for consistency. A plain
+                # INSERT: the row is never read back, so skip the ORM unit of work.
+                job_id = new_job_id()
+                now = datetime.utcnow()
+                await session.execute(
+                    insert(Job).values(
+                        id=job_id,
+                        status=JobStatus.COMPLETED,
+                        progress=100,
+                        progress_message=f"Video already exists (reused from cache)",
+                        video_id=existing_video.id,
+                        started_at=now,
+                        completed_at=now,
+                    )
                 )
-                session.add(job)
                 await session.commit()
 
-                return {
-                    "job_id": job.id,
+                return ORJSONResponse({
+                    "job_id": job_id,
                     "status": "completed",
                     "message": f"Video already exists for this URL. Reusing existing video (ID: {existing_video.id})",
-                }
+                })
 
         # URL not found, create new background job
         logger.info(f"Creating new video generation job for URL: {url}")
         job_id = await job_manager.create_job(video_generation_job, url=url)
 
-        return {
+        return ORJSONResponse({
             "job_id": job_id,
             "status": "pending",
             "message": f"Video generation job created. Use job_id to track progress.",
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error creating video generation job: {str(e)}")
@@ -320,16 +535,41 @@ async def cancel_job(job_id: str):
     return {"status": "cancelled", "message": f"Job {job_id} cancelled"}
 
 
+def parse_cursor(cursor: Optional[str]):
+    """Decode a pagination cursor query parameter, or raise a 400."""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def next_page_cursor(rows: list[dict], limit: int) -> Optional[str]:
+    """Cursor for the page after rows, or None if this was the last page."""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last["created_at"], last["id"])
+
+
 @app.get("/api/jobs")
-async def list_jobs(status: Optional[str] = None, limit: int = 50, offset: int = 0):
+async def list_jobs(
+    status: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+):
     """
     List all jobs with optional filtering.
 
     - **status**: Filter by status (pending, processing, completed, failed, cancelled)
     - **limit**: Maximum number of jobs to return (default: 50)
     - **offset**: Offset for pagination (default: 0)
+    - **cursor**: `next_cursor` from the previous page; faster than offset for deep pages
     """
     try:
+        after = parse_cursor(cursor)
         job_status_enum = None
         if status:
             try:
@@ -341,10 +581,14 @@ async def list_jobs(status: Optional[str] = None, limit: int = 50, offset: int =
                 )
 
         jobs = await job_manager.list_jobs(
-            status=job_status_enum, limit=limit, offset=offset
+            status=job_status_enum, limit=limit, offset=offset, after=after
         )
 
-        return {"jobs": jobs, "count": len(jobs)}
+        return ORJSONResponse({
+            "jobs": jobs,
+            "count": len(jobs),
+            "next_cursor": next_page_cursor(jobs, limit),
+        })
 
     except HTTPException:
         raise
@@ -357,7 +601,8 @@ async def list_jobs(status: Optional[str] = None, limit: int = 50, offset: int =
 async def list_videos(
     limit: int = 50,
     offset: int = 0,
-    storage_location: Optional[str] = None
+    storage_location: Optional[str] = None,
+    cursor: Optional[str] = None,
 ):
     """
     List all generated videos from database.
@@ -365,31 +610,54 @@ async def list_videos(
     - **limit**: Maximum number of videos to return (default: 50)
     - **offset**: Offset for pagination (default: 0)
     - **storage_location**: Filter by storage location ("local" or "cloud")
+    - **cursor**: `next_cursor` from the previous page; faster than offset for deep pages
     """
     try:
-        async with async_session() as session:
-            query = select(Video).order_by(Video.created_at.desc())
-
-            # Filter by storage location if specified
-            if storage_location:
-                try:
-                    location_enum = StorageLocation(storage_location.lower())
-                    query = query.where(Video.storage_location == location_enum)
-                except ValueError:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid storage_location. Must be 'local' or 'cloud'"
-                    )
+        # Plain row tuples for the listed columns: no ORM instances, and the
+        # large script_json text is never fetched. orjson encodes the enum and
+        # datetime values directly. The created_at index also holds the rowid
+        # (id), so the ORDER BY and the cursor seek walk it backwards.
+        query = select(*VIDEO_LIST_COLUMNS).order_by(
+            Video.created_at.desc(), Video.id.desc()
+        )
+        location_enum = None
 
+        after = parse_cursor(cursor)
+        if after:
+            query = query.where(tuple_(Video.created_at, Video.id) < after)
+
+        # Filter by storage location if specified
+        if storage_location:
+            try:
+                location_enum = StorageLocation(storage_location.lower())
+                query = query.where(Video.storage_location == location_enum)
+            except ValueError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid storage_location. Must be 'local' or 'cloud'"
+                )
+
+        cache_key = (limit, offset, location_enum, after)
+        cached = _videos_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < VIDEOS_CACHE_TTL:
+            return ORJSONResponse(cached[1])
+
+        async with async_session() as session:
             query = query.limit(limit).offset(offset)
             result = await session.execute(query)
-            videos = result.scalars().all()
+            videos = [row._asdict() for row in result]
 
-            return {
-                "videos": [video.to_dict() for video in videos],
+            response = {
+                "videos": videos,
                 "count": len(videos),
+                "next_cursor": next_page_cursor(videos, limit),
             }
 
+        if len(_videos_cache) >= VIDEOS_CACHE_MAX_ENTRIES:
+            _videos_cache.clear()
+        _videos_cache[cache_key] = (time.monotonic(), response)
+        return ORJSONResponse(response)
+
     except HTTPException:
         raise
     except Exception as e:
@@ -421,16 +689,16 @@ async def get_video_by_id(video_id: int):
             # Local file - convert relative path to absolute
             video_path = Path(video.file_path)
             if not video_path.is_absolute():
-                video_path = Path.cwd() / video_path
+                video_path = CWD / video_path
 
-            if not video_path.exists():
+            # stat() can block on slow disks or network mounts
+            video_stat = await asyncio.to_thread(stat_video_file, video_path)
+            if video_stat is None:
                 raise HTTPException(
                     status_code=404, detail="Video file not found on disk"
                 )
 
-            return FileResponse(
-                video_path, media_type="video/mp4", filename=video_path.name
-            )
+            return video_file_response(video_path, video_path.name, video_stat)
 
     except HTTPException:
         raise
@@ -459,20 +727,18 @@ async def delete_video(video_id: int):
             video_title = video.title
             storage_location = video.storage_location
             file_path = video.file_path
+            source_url = video.source_url
 
             # Delete from storage based on location
             storage_deleted = False
             if storage_location == StorageLocation.CLOUD:
                 # Extract object key from cloud URL
-                if file_path and file_path.startswith(("http://", "https://")):
-                    # Parse object key from URL (e.g., "videos/5/filename.mp4")
-                    # Format: https://domain/videos/5/filename.mp4
-                    parts = file_path.split("/")
-                    if len(parts) >= 3:
-                        object_key = "/".join(parts[-3:])  # videos/5/filename.mp4
-                        storage_deleted = await storage_manager.delete_video(object_key)
-                    else:
-                        logger.warning(f"Could not parse object key from URL: {file_path}")
+                # Format: https://domain/videos/5/filename.mp4
+                object_key = storage_manager.object_key_from_url(file_path)
+                if object_key:
+                    storage_deleted = await storage_manager.delete_video(object_key)
+                else:
+                    logger.warning(f"Could not parse object key from URL: {file_path}")
             else:  # LOCAL
                 if file_path:
                     storage_deleted = await storage_manager.delete_local_video(file_path)
@@ -480,6 +746,8 @@ async def delete_video(video_id: int):
             # Delete from database
             await session.delete(video)
             await session.commit()
+            invalidate_videos_cache()
+            await forget_video_url(source_url)
 
             logger.info(f"Deleted video ID {video_id}: {video_title}")
 
@@ -504,21 +772,20 @@ async def get_video(video_name: str):
     Download or stream a generated video by filename (legacy endpoint)
     """
     try:
-        output_folder = Path(OUTPUT_FOLDER)
-        video_path = output_folder / video_name
+        video_path = OUTPUT_FOLDER_RESOLVED / video_name
 
         # Security check: ensure the path is within OUTPUT_FOLDER
         try:
-            video_path = video_path.resolve()
-            output_folder = output_folder.resolve()
-            video_path.relative_to(output_folder)
+            video_path = await asyncio.to_thread(video_path.resolve)
+            video_path.relative_to(OUTPUT_FOLDER_RESOLVED)
         except ValueError:
             raise HTTPException(status_code=403, detail="Access denied")
 
-        if not video_path.exists():
+        video_stat = await asyncio.to_thread(stat_video_file, video_path)
+        if video_stat is None:
             raise HTTPException(status_code=404, detail="Video not found")
 
-        return FileResponse(video_path, media_type="video/mp4", filename=video_name)
+        return video_file_response(video_path, video_name, video_stat)
 
     except HTTPException:
         raise
@@ -535,18 +802,27 @@ async def websocket_endpoint(websocket: WebSocket):
     Supports job-specific tracking by sending {"subscribe": "job_id"}
     """
     await websocket.accept()
-    active_connections.append(websocket)
+    channel = Channel(websocket)
+    channel.task = asyncio.create_task(relay(channel))
+    active_channels.add(channel)
     subscribed_job_id: Optional[str] = None
     job_callback = None
 
     try:
-        await websocket.send_json(
-            {"type": "connection", "message": "Connected to ReelCraft API"}
-        )
+        await websocket.send_text(WS_CONNECTED_FRAME)
 
         # Handle incoming messages
         while True:
-            data = await websocket.receive_json()
+            try:
+                data = orjson.loads(
+                    await asyncio.wait_for(
+                        websocket.receive_text(), timeout=WS_HEARTBEAT_INTERVAL
+                    )
+                )
+            except asyncio.TimeoutError:
+                # Idle connection: heartbeat so dead clients are detected
+                await websocket.send_text(WS_PING_FRAME)
+                continue
 
             # Handle job subscription
             if isinstance(data, dict) and "subscribe" in data:
@@ -557,40 +833,36 @@ async def websocket_endpoint(websocket: WebSocket):
                     await job_manager.unregister_progress_callback(
                         subscribed_job_id, job_callback
                     )
+                    unsubscribe_channel(channel, subscribed_job_id)
 
                 # Create callback for this job
+                # Queued on the channel like broadcasts, so the job never
+                # waits on this client's socket
                 async def send_job_progress(progress: JobProgress):
-                    try:
-                        await websocket.send_json(
-                            {
-                                "type": "job_progress",
-                                "job_id": job_id,
-                                "progress": progress.progress,
-                                "message": progress.message,
-                            }
-                        )
-                    except Exception as e:
-                        logger.error(f"Error sending job progress: {e}")
+                    channel.push(job_progress_frame(job_id, progress.progress, progress.message))
 
                 job_callback = send_job_progress
                 subscribed_job_id = job_id
 
                 # Register callback with job manager
                 await job_manager.register_progress_callback(job_id, job_callback)
+                job_subscribers.setdefault(job_id, set()).add(channel)
 
-                await websocket.send_json(
+                await send_frame(
+                    websocket,
                     {
                         "type": "subscribed",
                         "job_id": job_id,
                         "message": f"Subscribed to job {job_id}",
-                    }
+                    },
                 )
 
                 # Send current job status
                 job_status = await job_manager.get_job_status(job_id)
                 if job_status:
-                    await websocket.send_json(
-                        {"type": "job_status", "job_id": job_id, "status": job_status}
+                    await send_frame(
+                        websocket,
+                        {"type": "job_status", "job_id": job_id, "status": job_status},
                     )
 
     except WebSocketDisconnect:
@@ -603,11 +875,28 @@ async def websocket_endpoint(websocket: WebSocket):
             await job_manager.unregister_progress_callback(
                 subscribed_job_id, job_callback
             )
-        if websocket in active_connections:
-            active_connections.remove(websocket)
+            unsubscribe_channel(channel, subscribed_job_id)
+        active_channels.discard(channel)
+        channel.task.cancel()
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=os.getenv("RELOAD", "0") == "1",
+        workers=int(os.getenv("WORKERS", "1")),
+        log_level="info",
+        # uvloop + httptools (C event loop and HTTP parser) when installed,
+        # which uvicorn[standard] does except on Windows; asyncio + h11 otherwise
+        loop="auto",
+        http="auto",
+        limit_concurrency=1000,
+        # Browsers reuse the connection across video Range requests
+        timeout_keep_alive=30,
+        ws_ping_interval=None,
+        ws_ping_timeout=None,
+    )
@@ -4,10 +4,61 @@ import os
 import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
-import logging
 from config.directories import AUDIO_DIR, VIDEO_DIR, IMAGE_DIR, OUTPUT_FOLDER
+from config.logger import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+BYTES_PER_MB = 1024 * 1024
+
+
+def size_in_mb(size_bytes: int) -> float:
+    """Convert a byte count to megabytes, rounded to 2 decimal places."""
+    return round(size_bytes / BYTES_PER_MB, 2)
+
+
+def _scan_files(dir_path) -> list[os.DirEntry]:
+    """
+    List the regular files in a directory.
+
+    os.scandir gets the file type from the directory listing itself, and
+    each DirEntry caches its stat() result, so callers stat a file at most
+    once instead of once per getsize/getmtime/isfile call.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return [entry for entry in it if entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _delete_files(files: list, log_prefix: str):
+    """
+    Delete a batch of files in one pass.
+
+    Args:
+        files: List of (dir_name, DirEntry) tuples
+        log_prefix: Prefix for the per-file log line (e.g., "Cleaned up")
+
+    Returns:
+        Tuple of (cleaned_count, cleaned_size)
+    """
+    cleaned_count = 0
+    cleaned_size = 0
+    if not files:
+        return cleaned_count, cleaned_size
+
+    for dir_name, entry in files:
+        try:
+            file_size = entry.stat().st_size
+            os.unlink(entry.path)
+            cleaned_count += 1
+            cleaned_size += file_size
+            logger.info(f"{log_prefix} {dir_name}: {entry.name}")
+        except Exception as e:
+            logger.error(f"Error cleaning {entry.path}: {e}")
+
+    return cleaned_count, cleaned_size
 
 
 def cleanup_generation_assets(video_title: str):
@@ -18,9 +69,6 @@ def cleanup_generation_assets(video_title: str):
     Args:
         video_title: Title of the video (used to match filenames)
     """
-    cleaned_count = 0
-    cleaned_size = 0
-
     # Sanitize title for filename matching
     sanitized_title = video_title.lower().replace(" ", "_")
 
@@ -31,25 +79,17 @@ def cleanup_generation_assets(video_title: str):
         (VIDEO_DIR, "videos")
     ]
 
-    for dir_path, dir_name in temp_dirs:
-        if not os.path.exists(dir_path):
-            continue
-
-        for file in os.listdir(dir_path):
-            # Match files that start with the video title
-            if file.lower().startswith(sanitized_title):
-                file_path = os.path.join(dir_path, file)
-                try:
-                    file_size = os.path.getsize(file_path)
-                    os.remove(file_path)
-                    cleaned_count += 1
-                    cleaned_size += file_size
-                    logger.info(f"Cleaned up {dir_name}: {file}")
-                except Exception as e:
-                    logger.error(f"Error cleaning {file_path}: {e}")
+    # Match files that start with the video title across all directories
+    files = [
+        (dir_name, entry)
+        for dir_path, dir_name in temp_dirs
+        for entry in _scan_files(dir_path)
+        if entry.name.lower().startswith(sanitized_title)
+    ]
+    cleaned_count, cleaned_size = _delete_files(files, "Cleaned up")
 
     if cleaned_count > 0:
-        size_mb = cleaned_size / (1024 * 1024)
+        size_mb = cleaned_size / BYTES_PER_MB
         logger.info(f"Cleaned up {cleaned_count} files ({size_mb:.2f} MB) for '{video_title}'")
 
     return cleaned_count, cleaned_size
@@ -63,7 +103,8 @@ def cleanup_old_assets(days: int = 7):
     Args:
         days: Delete files older than this many days (default: 7)
     """
-    cutoff_date = datetime.now() - timedelta(days=days)
+    # Compare raw st_mtime floats instead of building a datetime per file
+    cutoff = (datetime.now() - timedelta(days=days)).timestamp()
     cleaned_count = 0
     cleaned_size = 0
 
@@ -75,28 +116,22 @@ def cleanup_old_assets(days: int = 7):
     ]
 
     for dir_path, dir_name in temp_dirs:
-        if not os.path.exists(dir_path):
-            continue
-
-        for file in os.listdir(dir_path):
-            file_path = os.path.join(dir_path, file)
-
+        for entry in _scan_files(dir_path):
             try:
                 # Check file modification time
-                file_mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
+                st = entry.stat()
 
-                if file_mtime < cutoff_date:
-                    file_size = os.path.getsize(file_path)
-                    os.remove(file_path)
+                if st.st_mtime < cutoff:
+                    os.unlink(entry.path)
                     cleaned_count += 1
-                    cleaned_size += file_size
-                    logger.debug(f"Cleaned old {dir_name}: {file}")
+                    cleaned_size += st.st_size
+                    logger.debug(f"Cleaned old {dir_name}: {entry.name}")
 
             except Exception as e:
-                logger.error(f"Error cleaning {file_path}: {e}")
+                logger.error(f"Error cleaning {entry.path}: {e}")
 
     if cleaned_count > 0:
-        size_mb = cleaned_size / (1024 * 1024)
+        size_mb = cleaned_size / BYTES_PER_MB
         logger.info(f"Cleaned {cleaned_count} old files ({size_mb:.2f} MB) older than {days} days")
 
     return cleaned_count, cleaned_size
@@ -109,9 +144,6 @@ def cleanup_failed_generation(video_title: str):
     Args:
         video_title: Title of the failed video generation
     """
-    cleaned_count = 0
-    cleaned_size = 0
-
     sanitized_title = video_title.lower().replace(" ", "_")
 
     # Clean from ALL directories including outputs
@@ -122,24 +154,17 @@ def cleanup_failed_generation(video_title: str):
         (OUTPUT_FOLDER, "outputs")
     ]
 
-    for dir_path, dir_name in all_dirs:
-        if not os.path.exists(dir_path):
-            continue
-
-        for file in os.listdir(dir_path):
-            if file.lower().startswith(sanitized_title) or sanitized_title in file.lower():
-                file_path = os.path.join(dir_path, file)
-                try:
-                    file_size = os.path.getsize(file_path)
-                    os.remove(file_path)
-                    cleaned_count += 1
-                    cleaned_size += file_size
-                    logger.info(f"Cleaned failed generation {dir_name}: {file}")
-                except Exception as e:
-                    logger.error(f"Error cleaning {file_path}: {e}")
+    # A prefix match is also a substring match, so one check covers both
+    files = [
+        (dir_name, entry)
+        for dir_path, dir_name in all_dirs
+        for entry in _scan_files(dir_path)
+        if sanitized_title in entry.name.lower()
+    ]
+    cleaned_count, cleaned_size = _delete_files(files, "Cleaned failed generation")
 
     if cleaned_count > 0:
-        size_mb = cleaned_size / (1024 * 1024)
+        size_mb = cleaned_size / BYTES_PER_MB
         logger.info(f"Cleaned {cleaned_count} files ({size_mb:.2f} MB) from failed generation")
 
     return cleaned_count, cleaned_size
@@ -169,17 +194,16 @@ def get_storage_stats():
             stats[name] = {"files": 0, "size_mb": 0}
             continue
 
-        file_count = len(os.listdir(dir_path))
-        dir_size = sum(
-            os.path.getsize(os.path.join(dir_path, f))
-            for f in os.listdir(dir_path)
-            if os.path.isfile(os.path.join(dir_path, f))
-        )
+        # One directory pass; each file is stat()ed once. The count covers
+        # every entry (subdirectories included), sizes only regular files.
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+        file_count = len(entries)
+        dir_size = sum(entry.stat().st_size for entry in entries if entry.is_file())
 
-        size_mb = dir_size / (1024 * 1024)
         stats[name] = {
             "files": file_count,
-            "size_mb": round(size_mb, 2)
+            "size_mb": size_in_mb(dir_size)
         }
 
         total_files += file_count
@@ -187,7 +211,7 @@ def get_storage_stats():
 
     stats["total"] = {
         "files": total_files,
-        "size_mb": round(total_size / (1024 * 1024), 2)
+        "size_mb": size_in_mb(total_size)
     }
 
     return stats
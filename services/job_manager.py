@@ -1,16 +1,15 @@
 """Background job manager using asyncio tasks."""
 
 import asyncio
-import uuid
 from datetime import datetime
-from typing import Dict, Callable, Optional, Any
+from typing import Dict, Callable, Optional, Any, Tuple
 from dataclasses import dataclass
-import logging
 
-from sqlalchemy import select
-from services.database import async_session, Job, JobStatus, Video
+from sqlalchemy import select, tuple_
+from services.database import async_session, new_job_id, Job, JobStatus, Video
+from config.logger import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 @dataclass
@@ -25,7 +24,7 @@ class JobManager:
 
     def __init__(self):
         self._jobs: Dict[str, asyncio.Task] = {}
-        self._progress_callbacks: Dict[str, list[Callable]] = {}
+        self._progress_callbacks: Dict[str, set[Callable]] = {}
         self._lock = asyncio.Lock()
 
     async def create_job(self, job_func: Callable, *args, **kwargs) -> str:
@@ -39,7 +38,7 @@ class JobManager:
         Returns:
             Job ID (UUID string)
         """
-        job_id = str(uuid.uuid4())
+        job_id = new_job_id()
 
         # Create job record in database
         async with async_session() as session:
@@ -57,7 +56,7 @@ class JobManager:
 
         async with self._lock:
             self._jobs[job_id] = task
-            self._progress_callbacks[job_id] = []
+            self._progress_callbacks[job_id] = set()
 
         logger.info(f"Created job {job_id}")
         return job_id
@@ -178,15 +177,18 @@ class JobManager:
                 job.progress_message = message
                 await session.commit()
 
-        # Notify callbacks
+        # Notify callbacks concurrently so one slow subscriber doesn't delay the rest
         async with self._lock:
-            callbacks = self._progress_callbacks.get(job_id, [])
+            callbacks = tuple(self._progress_callbacks.get(job_id, ()))
 
-        for callback in callbacks:
-            try:
-                await callback(JobProgress(progress=progress, message=message))
-            except Exception as e:
-                logger.error(f"Error in progress callback: {e}")
+        job_progress = JobProgress(progress=progress, message=message)
+        results = await asyncio.gather(
+            *(callback(job_progress) for callback in callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in progress callback: {result}")
 
     async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -235,24 +237,20 @@ class JobManager:
             callback: Async function that receives JobProgress
         """
         async with self._lock:
-            if job_id not in self._progress_callbacks:
-                self._progress_callbacks[job_id] = []
-            self._progress_callbacks[job_id].append(callback)
+            self._progress_callbacks.setdefault(job_id, set()).add(callback)
 
     async def unregister_progress_callback(self, job_id: str, callback: Callable):
         """Unregister a progress callback."""
         async with self._lock:
             if job_id in self._progress_callbacks:
-                try:
-                    self._progress_callbacks[job_id].remove(callback)
-                except ValueError:
-                    pass
+                self._progress_callbacks[job_id].discard(callback)
 
     async def list_jobs(
         self,
         status: Optional[JobStatus] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> list[Dict[str, Any]]:
         """
         List jobs with optional filtering.
@@ -261,21 +259,36 @@ class JobManager:
             status: Filter by status
             limit: Maximum number of jobs to return
             offset: Offset for pagination
+            after: (created_at, id) of the last job on the previous page; seeks
+                straight past it instead of skipping rows like offset does
 
         Returns:
-            List of job dictionaries
+            List of job dictionaries (status as JobStatus, timestamps as datetime)
         """
         async with async_session() as session:
-            query = select(Job).order_by(Job.created_at.desc())
+            # Select plain columns (same keys as Job.to_dict()) rather than
+            # building ORM instances; the values are left for orjson to encode
+            query = select(
+                Job.id,
+                Job.status,
+                Job.progress,
+                Job.progress_message,
+                Job.error_message,
+                Job.created_at,
+                Job.started_at,
+                Job.completed_at,
+                Job.video_id,
+            ).order_by(Job.created_at.desc(), Job.id.desc())
 
             if status:
                 query = query.where(Job.status == status)
+            if after:
+                query = query.where(tuple_(Job.created_at, Job.id) < after)
 
             query = query.limit(limit).offset(offset)
             result = await session.execute(query)
-            jobs = result.scalars().all()
 
-            return [job.to_dict() for job in jobs]
+            return [row._asdict() for row in result]
 
 
 # Global job manager instance
@@ -0,0 +1,28 @@
+"""Opaque cursors for keyset (seek) pagination over newest-first listings."""
+
+import base64
+from datetime import datetime
+from typing import Any
+
+import orjson
+
+
+def encode_cursor(created_at: datetime, row_id: Any) -> str:
+    """Encode the (created_at, id) of the last row on a page."""
+    raw = orjson.dumps([created_at.isoformat(), row_id])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = orjson.loads(raw)
+        return datetime.fromisoformat(created_at), row_id
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
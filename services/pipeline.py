@@ -1,15 +1,18 @@
-import json
-import os
+import orjson
 import asyncio
 from typing import Callable, Optional
-from pydub import AudioSegment
 from utils.assets import search_and_download_asset
-from utils.ai import generate_audio_file, gemini_llm_call
+from utils.ai import generate_audio_file, gemini_llm_call, get_wav_duration
 from utils.fire_crawl import get_webpage_markdown, WebScrapingError
 from utils.video_editing import script_to_asset_details, video_editing_pipeline
 from config.prompts import SCRIPT_GENERATOR_SYSTEM
 
 
+def scene_file_name(reel_title: str, scene_number: int) -> str:
+    """Sanitized base name (no extension) shared by a scene's audio and asset files."""
+    return f"{reel_title}_{scene_number}".lower().replace(" ", "_")
+
+
 async def pipeline(url: str, progress_callback: Optional[Callable] = None):
     """
     Main video generation pipeline with progress tracking.
@@ -57,35 +60,37 @@ ARTICLE CONTENT:
     )
 
     if isinstance(script, str):
-        script = json.loads(script)
+        script = orjson.loads(script)
 
     reel_title = script["title"]
     scenes = script["scenes"]
     await update_progress(25, f"Script generated with {len(scenes)} scenes")
 
-    # Step 3: Generate audio files
-    await update_progress(30, "Generating voice-over audio...")
+    # Step 3: Generate audio files and download assets. The two are independent
+    # per scene, so run them concurrently instead of one phase after the other.
+    await update_progress(30, "Generating voice-over audio and downloading visual assets...")
+    file_names = {
+        scene["scene_number"]: scene_file_name(reel_title, scene["scene_number"])
+        for scene in scenes
+    }
     audio_tasks = [
-        generate_audio_file(scene["script"], f"{reel_title}_{scene['scene_number']}")
+        generate_audio_file(scene["script"], file_names[scene["scene_number"]])
         for scene in scenes
     ]
 
-    audio_file_paths = await asyncio.gather(*audio_tasks)
-    await update_progress(50, "Audio generation completed")
+    audio_file_paths, script = await asyncio.gather(
+        asyncio.gather(*audio_tasks),
+        generate_assets(script, progress_callback=update_progress, file_names=file_names),
+    )
+    await update_progress(75, "Audio generated and assets downloaded")
 
     # Assign the generated audio file paths back to scenes
     for scene, audio_file_path in zip(scenes, audio_file_paths):
         scene["audio_file_path"] = audio_file_path
-        # Get audio duration in seconds
-        audio = AudioSegment.from_wav(audio_file_path)
-        scene["duration"] = len(audio) / 1000.0  # Convert milliseconds to seconds
-
-    # Step 4: Download assets
-    await update_progress(55, "Downloading visual assets...")
-    script = await generate_assets(script, progress_callback=update_progress)
-    await update_progress(75, "Assets downloaded successfully")
+        # Get audio duration in seconds from the WAV header
+        scene["duration"] = get_wav_duration(audio_file_path)
 
-    # Step 5: Transform script to asset_details and create final video
+    # Step 4: Transform script to asset_details and create final video
     await update_progress(80, "Composing video...")
     asset_details = await script_to_asset_details(script)
 
@@ -108,20 +113,26 @@ ARTICLE CONTENT:
     }
 
 
-async def generate_assets(script: dict, progress_callback: Optional[Callable] = None):
+async def generate_assets(
+    script: dict,
+    progress_callback: Optional[Callable] = None,
+    file_names: Optional[dict[int, str]] = None,
+):
     """
     Generate and download assets for all scenes.
 
     Args:
         script: Script dictionary with scenes
         progress_callback: Optional progress callback function
+        file_names: Optional {scene_number: sanitized base name} mapping;
+            names missing from it are built with scene_file_name()
 
     Returns:
         Updated script with asset file paths
     """
     # Parse script if it's a string
     if isinstance(script, str):
-        script = json.loads(script)
+        script = orjson.loads(script)
 
     reel_title = script["title"]
     scenes = script["scenes"]
@@ -147,8 +158,8 @@ async def generate_assets(script: dict, progress_callback: Optional[Callable] =
         # Pick the first keyword for simplicity
         keyword = asset_keywords[0] if asset_keywords else "generic"
 
-        # Sanitize filename: lowercase and remove spaces (same as audio pipeline)
-        file_name = f"{reel_title}_{scene_number}".lower().replace(" ", "_")
+        # Same base name as the scene's audio file
+        file_name = (file_names or {}).get(scene_number) or scene_file_name(reel_title, scene_number)
 
         # Determine the actual asset type to download
         # Handle cases like "image/video" by defaulting to video
@@ -156,7 +167,7 @@ async def generate_assets(script: dict, progress_callback: Optional[Callable] =
 
         # Create async task for downloading asset with AI filtering
         asset_tasks.append(
-            (scene_number, search_and_download_asset(
+            (scene, search_and_download_asset(
                 keyword=keyword,
                 asset_type=actual_asset_type,
                 file_name=file_name,
@@ -171,11 +182,8 @@ async def generate_assets(script: dict, progress_callback: Optional[Callable] =
         results = await asyncio.gather(*[task for _, task in asset_tasks])
 
         # Assign the generated asset file paths back to scenes
-        for (scene_number, _), asset_file_path in zip(asset_tasks, results):
-            for scene in scenes:
-                if scene["scene_number"] == scene_number:
-                    scene["asset_file_path"] = asset_file_path
-                    break
+        for (scene, _), asset_file_path in zip(asset_tasks, results):
+            scene["asset_file_path"] = asset_file_path
 
     return script
 
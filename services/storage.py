@@ -2,13 +2,13 @@
 
 import os
 from pathlib import Path
-from typing import Optional
-import logging
-from urllib.parse import quote
+from typing import Optional, Union
+from urllib.parse import quote, urlparse
 from dotenv import load_dotenv
+from config.logger import get_logger
 
 load_dotenv()
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 # Storage configuration
 STORAGE_PROVIDER = os.getenv("STORAGE_PROVIDER", "local")  # local, r2, s3, gcs
@@ -61,13 +61,13 @@ class StorageManager:
         """Check if cloud storage is enabled and configured."""
         return R2_ENABLED and self.r2_client is not None
 
-    async def upload_video(self, local_path: str, video_id: int) -> Optional[str]:
+    async def upload_video(self, local_path: str, video_key: Union[int, str]) -> Optional[str]:
         """
         Upload video to cloud storage.
 
         Args:
             local_path: Path to local video file
-            video_id: Database video ID
+            video_key: Database video ID or a pre-assigned unique key (e.g., UUID hex)
 
         Returns:
             Public URL of uploaded video, or None if upload failed/disabled
@@ -83,7 +83,7 @@ class StorageManager:
                 return None
 
             # Generate object key (path in bucket)
-            object_key = f"videos/{video_id}/{file_path.name}"
+            object_key = f"videos/{video_key}/{file_path.name}"
 
             # Upload to R2
             logger.info(f"Uploading {file_path.name} to R2...")
@@ -165,6 +165,28 @@ class StorageManager:
             logger.error(f"Error deleting local video: {e}")
             return False
 
+    @staticmethod
+    def object_key_from_url(url: Optional[str]) -> Optional[str]:
+        """
+        Extract the bucket object key from a cloud video URL.
+
+        Args:
+            url: Public URL (e.g., "https://domain/videos/5/video.mp4")
+
+        Returns:
+            Object key (e.g., "videos/5/video.mp4"), or None if the URL
+            is not an http(s) URL with at least three path segments
+        """
+        if not url:
+            return None
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return None
+        parts = parsed.path.rsplit("/", 3)
+        if len(parts) < 4:
+            return None
+        return "/".join(parts[-3:])
+
     def get_video_url(self, video_id: int, filename: str) -> str:
         """
         Get public URL for a video.
@@ -0,0 +1,93 @@
+"""Cache of source URL -> video ID for the duplicate-URL check."""
+
+import hashlib
+import os
+from typing import Optional
+from dotenv import load_dotenv
+from config.logger import get_logger
+
+load_dotenv()
+logger = get_logger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")  # e.g., redis://localhost:6379/0
+VIDEO_URL_CACHE_TTL = 86400  # seconds
+VIDEO_URL_CACHE_MAX_ENTRIES = 1024
+
+# Redis client when REDIS_URL is set and redis is installed; otherwise IDs
+# are kept in this process only.
+_redis = None
+_local_cache: dict[str, int] = {}
+
+
+def video_url_cache_key(url: str) -> str:
+    """Cache key for a source URL."""
+    return f"video_url:{hashlib.sha1(url.encode()).hexdigest()}"
+
+
+async def init_url_cache():
+    """Connect to Redis if configured."""
+    global _redis
+    if not REDIS_URL:
+        return
+
+    try:
+        import redis.asyncio as redis
+
+        client = redis.from_url(REDIS_URL, decode_responses=True)
+        await client.ping()
+        _redis = client
+        logger.info("Redis URL cache connected")
+    except ImportError:
+        logger.warning("redis not installed. Run: uv add redis")
+    except Exception as e:
+        logger.error(f"Failed to connect to Redis, using in-process URL cache: {e}")
+
+
+async def close_url_cache():
+    """Close the Redis connection, if one was opened."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+async def get_cached_video_id(url: str) -> Optional[int]:
+    """Get the cached video ID for a source URL, or None on a miss."""
+    key = video_url_cache_key(url)
+    if _redis is None:
+        return _local_cache.get(key)
+
+    try:
+        video_id = await _redis.get(key)
+    except Exception as e:
+        logger.warning(f"Redis get failed: {e}")
+        return None
+    return int(video_id) if video_id is not None else None
+
+
+async def cache_video_id(url: str, video_id: int):
+    """Remember which video was generated from a source URL."""
+    key = video_url_cache_key(url)
+    if _redis is None:
+        if len(_local_cache) >= VIDEO_URL_CACHE_MAX_ENTRIES:
+            _local_cache.clear()
+        _local_cache[key] = video_id
+        return
+
+    try:
+        await _redis.setex(key, VIDEO_URL_CACHE_TTL, video_id)
+    except Exception as e:
+        logger.warning(f"Redis setex failed: {e}")
+
+
+async def forget_video_url(url: str):
+    """Drop the cached video ID for a source URL."""
+    key = video_url_cache_key(url)
+    if _redis is None:
+        _local_cache.pop(key, None)
+        return
+
+    try:
+        await _redis.delete(key)
+    except Exception as e:
+        logger.warning(f"Redis delete failed: {e}")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Quick test script for the mock fixtures.
+"""
+from mocks.mock import MOCK_LLM_RESPONSE, get_mock_llm_response
+
+
+def test_mock_llm_response_shared():
+    """Test that the default accessor hands back the same object every call."""
+    print("Testing shared mock LLM response...")
+    if get_mock_llm_response() is get_mock_llm_response() is MOCK_LLM_RESPONSE:
+        print("✓ Same object returned on repeated calls")
+        return True
+    print("✗ Accessor returned a new object")
+    return False
+
+
+def test_mock_llm_response_copy():
+    """Test that copy=True returns an independent deep copy."""
+    print("\nTesting copied mock LLM response...")
+    copied = get_mock_llm_response(copy=True)
+    copied["scenes"][0]["script"] = "changed"
+    if copied == MOCK_LLM_RESPONSE or copied["scenes"][0] is MOCK_LLM_RESPONSE["scenes"][0]:
+        print("✗ Copy shares state with MOCK_LLM_RESPONSE")
+        return False
+    print("✓ Copy is independent")
+    return True
+
+
+def main():
+    """Run all tests."""
+    results = [test_mock_llm_response_shared(), test_mock_llm_response_copy()]
+
+    print("\n" + "=" * 60)
+    print(f"RESULTS: {sum(results)}/{len(results)} tests passed")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,12 @@ def wave_file(filename, pcm, channels=1, rate=24000, sample_width=2):
         wf.writeframes(pcm)
 
 
+def get_wav_duration(filename) -> float:
+    """Duration of a WAV file in seconds, read from its header."""
+    with wave.open(filename, "rb") as wf:
+        return wf.getnframes() / wf.getframerate()
+
+
 client = genai.Client(api_key=GEMINI_API_KEY)
 
 # Global async client for reuse across requests
@@ -72,7 +78,8 @@ async def generate_audio_file(content: str, file_name: str, max_retries: int = 3
 
     Args:
         content: Text content to convert to speech
-        file_name: Name for the output audio file (without extension)
+        file_name: Sanitized name for the output audio file (without extension),
+            see services.pipeline.scene_file_name
         max_retries: Maximum number of retry attempts (default: 3)
 
     Returns:
@@ -82,9 +89,7 @@ async def generate_audio_file(content: str, file_name: str, max_retries: int = 3
         Exception: If all retry attempts fail
     """
     async with AUDIO_GENERATION_SEMAPHORE:
-        # Sanitize filename: lowercase and remove spaces
-        sanitized_name = file_name.lower().replace(" ", "_")
-        logger.info(f"Generating audio for: {sanitized_name}")
+        logger.info(f"Generating audio for: {file_name}")
 
         aclient = await get_async_client()
 
@@ -107,7 +112,7 @@ async def generate_audio_file(content: str, file_name: str, max_retries: int = 3
                 )
 
                 data = response.candidates[0].content.parts[0].inline_data.data
-                output_path = os.path.join(AUDIO_DIR, f"{sanitized_name}.wav")
+                output_path = os.path.join(AUDIO_DIR, f"{file_name}.wav")
                 wave_file(output_path, data)
 
                 logger.info(f"Audio generated: {output_path}")
@@ -115,7 +120,7 @@ async def generate_audio_file(content: str, file_name: str, max_retries: int = 3
 
             except Exception as e:
                 last_error = e
-                logger.warning(f"Audio generation attempt {attempt + 1}/{max_retries} failed for {sanitized_name}: {str(e)}")
+                logger.warning(f"Audio generation attempt {attempt + 1}/{max_retries} failed for {file_name}: {str(e)}")
 
                 if attempt < max_retries - 1:
                     # Exponential backoff: 1s, 2s, 4s
@@ -123,7 +128,7 @@ async def generate_audio_file(content: str, file_name: str, max_retries: int = 3
                     logger.info(f"Retrying in {wait_time} seconds...")
                     await asyncio.sleep(wait_time)
                 else:
-                    logger.error(f"All {max_retries} attempts failed for {sanitized_name}")
+                    logger.error(f"All {max_retries} attempts failed for {file_name}")
                     raise Exception(f"Failed to generate audio after {max_retries} attempts: {str(last_error)}")
 
 
@@ -232,10 +237,6 @@ async def gemini_llm_call(
                 )
             except Exception as e:
                 logger.debug(f"Failed to update Langfuse context: {e}")
-        client = genai.Client(
-            api_key=os.getenv("GEMINI_API_KEY"),
-        )
-
         response_mime_type = "application/json" if json_format else "text/plain"
         if is_thinking_enabled:
             thinking_budget = kwargs.get("thinking_budget", 1024)
@@ -261,8 +262,10 @@ async def gemini_llm_call(
         # Prepare contents with optional images
         contents = _prepare_contents(user_prompt, image_urls, image_file_path)
 
-        # Call the Gemini API with combined contents (images + prompt)
-        response = client.models.generate_content(
+        # Call the Gemini API with combined contents (images + prompt), reusing
+        # the shared async client and its connection pool
+        aclient = await get_async_client()
+        response = await aclient.models.generate_content(
             model=model_name,
             contents=contents,
             config=config,
@@ -301,7 +304,9 @@ async def gemini_llm_call(
             except Exception as e:
                 logger.debug(f"Failed to update Langfuse with I/O: {e}")
 
-        print(messages)
+        # Lazy args: the messages include the whole article, so only format
+        # them when debug logging is actually enabled
+        logger.debug("Gemini messages: %s", messages)
         return response.text
 
     except Exception as e:
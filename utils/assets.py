@@ -1,11 +1,14 @@
 import os
+import asyncio
 from pathlib import Path
 from dotenv import load_dotenv
 from config.directories import IMAGE_DIR, VIDEO_DIR
 from .http_client import PexelsClient, HTTPClient
 from .ai import gemini_llm_call
+from config.logger import get_logger
 
 load_dotenv()
+logger = get_logger(__name__)
 
 # Configuration
 PEXELS_API_KEY = os.getenv("PEXELS_API_KEY")
@@ -14,11 +17,31 @@ PEXELS_API_KEY = os.getenv("PEXELS_API_KEY")
 # Initialize Pexels client
 pexels_client = PexelsClient(api_key=PEXELS_API_KEY)
 
+# Pexels search results keyed by (kind, keyword, orientation, per_page). Scenes
+# that share a keyword await the same task, so one request serves all of them.
+SEARCH_CACHE_MAX_ENTRIES = 256
+_search_cache: dict[tuple, asyncio.Task] = {}
+
+
+async def _cached_search(search, kind, keyword, orientation, per_page):
+    """Run a Pexels search once per key, sharing in-flight and finished results."""
+    key = (kind, keyword, orientation, per_page)
+    task = _search_cache.get(key)
+    if task is None or (task.done() and (task.cancelled() or task.exception())):
+        if len(_search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.clear()
+        task = asyncio.ensure_future(
+            search(query=keyword, orientation=orientation, per_page=per_page)
+        )
+        _search_cache[key] = task
+    # shield() so one cancelled waiter doesn't cancel the search for the others
+    return await asyncio.shield(task)
+
 
 async def search_image(keyword, orientation="portrait", per_page=1):
     """Search for images on Pexels."""
-    return await pexels_client.search_photos(
-        query=keyword, orientation=orientation, per_page=per_page
+    return await _cached_search(
+        pexels_client.search_photos, "image", keyword, orientation, per_page
     )
 
 
@@ -37,14 +60,14 @@ async def download_image(photo_id, file_name):
     http_client = HTTPClient()
     await http_client.download_file(img_url, file_path)
 
-    print(f"Image downloaded successfully: {file_path}")
+    logger.info(f"Image downloaded successfully: {file_path}")
     return str(file_path)
 
 
 async def search_video(keyword, orientation="portrait", per_page=1):
     """Search for videos on Pexels."""
-    return await pexels_client.search_videos(
-        query=keyword, orientation=orientation, per_page=per_page
+    return await _cached_search(
+        pexels_client.search_videos, "video", keyword, orientation, per_page
     )
 
 
@@ -61,8 +84,8 @@ async def download_video(video_id, file_name, quality="hd"):
     # If requested quality not found, use first available video file
     if not video_link and video_data["video_files"]:
         video_link = video_data["video_files"][0]["link"]
-        print(
-            f"Warning: {quality.upper()} quality not found, using first available video"
+        logger.warning(
+            f"{quality.upper()} quality not found, using first available video"
         )
 
     if not video_link:
@@ -81,7 +104,7 @@ async def download_video(video_id, file_name, quality="hd"):
     http_client = HTTPClient()
     await http_client.download_file(video_link, file_path)
 
-    print(f"Video downloaded successfully: {file_path}")
+    logger.info(f"Video downloaded successfully: {file_path}")
     return str(file_path)
 
 
@@ -152,11 +175,11 @@ Which option number (1-{len(asset_options)}) is the BEST contextual match for th
                 return choice
 
         # Default to first option if parsing fails
-        print(f"Warning: Could not parse AI response '{response}', defaulting to first option")
+        logger.warning(f"Could not parse AI response '{response}', defaulting to first option")
         return 0
 
     except Exception as e:
-        print(f"Warning: AI filtering failed ({e}), defaulting to first option")
+        logger.warning(f"AI filtering failed ({e}), defaulting to first option")
         return 0
 
 
@@ -211,7 +234,7 @@ async def search_and_download_asset(
             ]
             best_index = await ai_filter_best_asset(script_text, asset_options, asset_type="image")
             photo_id = photos[best_index]["id"]
-            print(f"AI selected image {best_index + 1}/{len(photos)} for script: '{script_text[:50]}...'")
+            logger.info(f"AI selected image {best_index + 1}/{len(photos)} for script: '{script_text[:50]}...'")
         else:
             photo_id = photos[0]["id"]
 
@@ -243,7 +266,7 @@ async def search_and_download_asset(
             ]
             best_index = await ai_filter_best_asset(script_text, asset_options, asset_type="video")
             video_id = videos[best_index]["id"]
-            print(f"AI selected video {best_index + 1}/{len(videos)} for script: '{script_text[:50]}...'")
+            logger.info(f"AI selected video {best_index + 1}/{len(videos)} for script: '{script_text[:50]}...'")
         else:
             video_id = videos[0]["id"]
 
@@ -1,8 +1,9 @@
 """Clean all temporary assets (audio, images, videos) while keeping output videos."""
 
+import os
 import sys
 from pathlib import Path
-from services.cleanup import get_storage_stats
+from services.cleanup import BYTES_PER_MB, get_storage_stats
 from config.directories import AUDIO_DIR, VIDEO_DIR, IMAGE_DIR
 import logging
 
@@ -51,7 +52,9 @@ def cleanup_all_temp_assets():
             print(f"\n{dir_name}: Directory does not exist, skipping...")
             continue
 
-        files = list(Path(dir_path).glob("*"))
+        # DirEntry caches file type from the directory listing itself
+        with os.scandir(dir_path) as it:
+            files = [entry for entry in it if entry.is_file()]
         if not files:
             print(f"\n{dir_name}: No files to clean")
             continue
@@ -60,17 +63,16 @@ def cleanup_all_temp_assets():
         cleaned_count = 0
         cleaned_size = 0
 
-        for file_path in files:
-            if file_path.is_file():
-                try:
-                    file_size = file_path.stat().st_size
-                    file_path.unlink()
-                    cleaned_count += 1
-                    cleaned_size += file_size
-                except Exception as e:
-                    logger.error(f"Error deleting {file_path}: {e}")
-
-        size_mb = cleaned_size / (1024 * 1024)
+        for entry in files:
+            try:
+                file_size = entry.stat().st_size
+                os.unlink(entry.path)
+                cleaned_count += 1
+                cleaned_size += file_size
+            except Exception as e:
+                logger.error(f"Error deleting {entry.path}: {e}")
+
+        size_mb = cleaned_size / BYTES_PER_MB
         print(f"  Cleaned {cleaned_count} files ({size_mb:.2f} MB)")
 
         total_cleaned += cleaned_count
@@ -92,7 +94,7 @@ def cleanup_all_temp_assets():
         print(f"  {'TOTAL':12s}: {total_info['files']:3d} files, {total_info['size_mb']:8.2f} MB")
 
     # Summary
-    total_mb = total_size / (1024 * 1024)
+    total_mb = total_size / BYTES_PER_MB
     print("\n" + "="*60)
     print("CLEANUP SUMMARY")
     print("="*60)
@@ -1,24 +1,65 @@
 import os
 import asyncio
+import hashlib
+import time
+from pathlib import Path
 from firecrawl import Firecrawl
 from dotenv import load_dotenv
+from config.directories import WEBPAGE_CACHE_DIR
+from config.logger import get_logger
 
 load_dotenv()
+logger = get_logger(__name__)
 
 FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
 
+# How long a scraped page is reused from disk, in seconds. Off (0) unless set.
+WEBPAGE_CACHE_TTL = int(os.getenv("WEBPAGE_CACHE_TTL", "0"))
+
 
 class WebScrapingError(Exception):
     """Custom exception for web scraping failures."""
     pass
 
 
+def _cache_path(url: str) -> Path:
+    """Path of the cached markdown for a URL."""
+    key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    return WEBPAGE_CACHE_DIR / f"{key}.md"
+
+
+def _read_cache(url: str) -> str | None:
+    """Return cached markdown for a URL if it exists and hasn't expired."""
+    path = _cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime >= WEBPAGE_CACHE_TTL:
+            return None
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _write_cache(url: str, markdown: str) -> None:
+    """Store markdown for a URL, replacing any previous entry atomically."""
+    path = _cache_path(url)
+    tmp_path = path.with_suffix(".md.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(markdown, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to cache webpage markdown for {url}: {e}")
+
+
 async def get_webpage_markdown(
     url: str,
 ) -> str:
     """
     Scrape a webpage and return its content in markdown format.
 
+    When WEBPAGE_CACHE_TTL is set, successful scrapes are cached on disk for
+    that many seconds, so repeat requests for the same URL skip FireCrawl.
+
     Args:
         url: The URL of the webpage to scrape
 
@@ -29,21 +70,23 @@ async def get_webpage_markdown(
         ValueError: If no API key is provided
         WebScrapingError: If scraping fails or returns invalid content
     """
+    if WEBPAGE_CACHE_TTL > 0:
+        cached = await asyncio.to_thread(_read_cache, url)
+        if cached is not None:
+            logger.info(f"Using cached webpage markdown for {url}")
+            return cached
+
     if not FIRECRAWL_API_KEY:
         raise ValueError(
             "API key must be provided or set in FIRECRAWL_API_KEY environment variable"
         )
 
     try:
-        # Run the synchronous scraping in an executor to avoid blocking
-        loop = asyncio.get_event_loop()
+        # Run the synchronous scraping in a worker thread to avoid blocking
         firecrawl = Firecrawl(api_key=FIRECRAWL_API_KEY)
 
         # Scrape the URL and get markdown content
-        doc = await loop.run_in_executor(
-            None,
-            lambda: firecrawl.scrape(url, formats=["markdown"])
-        )
+        doc = await asyncio.to_thread(firecrawl.scrape, url, formats=["markdown"])
 
         if not doc or not hasattr(doc, 'markdown'):
             raise WebScrapingError(f"Failed to scrape content from {url}: Invalid response")
@@ -71,6 +114,8 @@ async def get_webpage_markdown(
                     f"Failed to scrape content from {url}: Page returned an error ({indicator})"
                 )
 
+        if WEBPAGE_CACHE_TTL > 0:
+            await asyncio.to_thread(_write_cache, url, markdown)
         return markdown
 
     except WebScrapingError:
@@ -5,6 +5,7 @@ This module provides a centralized HTTP client for making API requests
 across the application with consistent error handling and configuration.
 """
 
+import os
 import httpx
 from typing import Optional, Dict, Any
 from pathlib import Path
@@ -38,6 +39,32 @@ def async_retry(max_attempts=3, backoff_base=2, exceptions=(httpx.ConnectTimeout
     return decorator
 
 
+# One pooled client shared by every HTTPClient, so requests to the same host
+# reuse keep-alive connections instead of paying a TCP + TLS handshake each time.
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get or create the shared AsyncClient for the running event loop."""
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared AsyncClient, if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
 class HTTPClient:
     """Async HTTP client wrapper for making API requests."""
 
@@ -82,15 +109,15 @@ class HTTPClient:
         Raises:
             httpx.HTTPStatusError: If response status is 4xx or 5xx
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            full_url = self._build_url(url)
-            merged_headers = {**self.default_headers, **(headers or {})}
+        client = get_shared_client()
+        full_url = self._build_url(url)
+        merged_headers = {**self.default_headers, **(headers or {})}
 
-            response = await client.get(
-                full_url, params=params, headers=merged_headers, **kwargs
-            )
-            response.raise_for_status()
-            return response
+        response = await client.get(
+            full_url, params=params, headers=merged_headers, timeout=self.timeout, **kwargs
+        )
+        response.raise_for_status()
+        return response
 
     async def post(
         self,
@@ -116,15 +143,15 @@ class HTTPClient:
         Raises:
             httpx.HTTPStatusError: If response status is 4xx or 5xx
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            full_url = self._build_url(url)
-            merged_headers = {**self.default_headers, **(headers or {})}
+        client = get_shared_client()
+        full_url = self._build_url(url)
+        merged_headers = {**self.default_headers, **(headers or {})}
 
-            response = await client.post(
-                full_url, data=data, json=json, headers=merged_headers, **kwargs
-            )
-            response.raise_for_status()
-            return response
+        response = await client.post(
+            full_url, data=data, json=json, headers=merged_headers, timeout=self.timeout, **kwargs
+        )
+        response.raise_for_status()
+        return response
 
     async def download_file(
         self,
@@ -148,24 +175,29 @@ class HTTPClient:
         Raises:
             httpx.HTTPStatusError: If response status is 4xx or 5xx
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            full_url = self._build_url(url)
-            merged_headers = {**self.default_headers, **(headers or {})}
+        client = get_shared_client()
+        full_url = self._build_url(url)
+        merged_headers = {**self.default_headers, **(headers or {})}
 
-            response = await client.get(full_url, headers=merged_headers, **kwargs)
-            response.raise_for_status()
+        response = await client.get(
+            full_url, headers=merged_headers, timeout=self.timeout, **kwargs
+        )
+        response.raise_for_status()
 
-            # Ensure file_path is a Path object
-            file_path = Path(file_path) if isinstance(file_path, str) else file_path
+        # Ensure file_path is a Path object
+        file_path = Path(file_path) if isinstance(file_path, str) else file_path
 
-            # Create parent directories if they don't exist
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create parent directories if they don't exist
+        file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file
-            with open(file_path, "wb") as f:
-                f.write(response.content)
+        # Write to a temp file and swap it in, so an interrupted download
+        # never leaves a truncated asset at file_path
+        tmp_path = file_path.with_name(f"{file_path.name}.part")
+        with open(tmp_path, "wb") as f:
+            f.write(response.content)
+        os.replace(tmp_path, file_path)
 
-            return file_path
+        return file_path
 
     async def get_json(
         self,